@@ -66,6 +66,9 @@ export class NewsService {
       let stdout = '';
       let stderr = '';
 
+      // Decode as a stream so multi-byte UTF-8 characters split across chunks survive
+      pythonProcess.stdout.setEncoding('utf8');
+
       pythonProcess.stdout.on('data', (data) => {
         stdout += data.toString();
       });
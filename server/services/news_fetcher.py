@@ -1,27 +1,349 @@
 #!/usr/bin/env python3
 """Simple HVAC Industry News Fetcher.
 
-This script now uses the :mod:`gnews` package to query Google News for
-HVAC, BESS and finance related articles. The resulting articles are
+This script queries Google News for HVAC, BESS and finance related
+articles, using the :mod:`gnews` package when it is installed and a
+minimal built-in client otherwise. The resulting articles are
 normalized into a structure consumed by the Node.js server and printed
 to STDOUT as JSON.
 """
 
 from __future__ import annotations
 
+import hashlib
 import json
 import re
 import sys
-from datetime import datetime
+import textwrap
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
 from email.utils import parsedate_to_datetime
 from html import unescape
+from itertools import islice, zip_longest
+from pathlib import Path
+from typing import Iterable, Iterator
+from urllib.parse import quote
+
+import ahocorasick
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import HTTPError as Urllib3Error
+
+# gnews pulls in feedparser and BeautifulSoup; only pay for them when present
+try:
+    from gnews import GNews
+except ImportError:  # built-in client fallback
+    GNews = None
+
+try:
+    from lxml import etree as ET
+except ImportError:  # pragma: no cover - stdlib fallback
+    import xml.etree.ElementTree as ET
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - stdlib fallback
+    orjson = None
+
+# Validators and parsed items of previously downloaded feeds, shared across runs
+FEED_CACHE_PATH = Path(__file__).resolve().parents[2] / "data" / "rss_etags.json"
+
+BASE_URL = "https://news.google.com/rss"
+_GOOGLE_NEWS_RE = re.compile(r"^http(s)?://(www.)?news.google.com")
+
+_TAG_RE = re.compile(r"<[^<]+?>")
+# Text up to the first ". " when that sentence fits in a summary
+_SENT_RE = re.compile(r"(.{0,120}?)\. ", re.DOTALL)
+
+
+def _title_hash(title: str) -> int:
+    """Return a stable 64-bit fingerprint of ``title`` for de-duplication.
+
+    Case and runs of whitespace are normalised first, so titles that differ
+    only in those respects collapse to the same fingerprint.
+    """
+
+    canonical = " ".join(title.split()).casefold()
+    digest = hashlib.blake2b(canonical.encode(), digest_size=8).digest()
+    return int.from_bytes(digest, "big")
+
+
+def _round_robin(groups: Iterable[list]) -> Iterator:
+    """Yield one item from each of ``groups`` in turn until all are exhausted."""
+
+    for batch in zip_longest(*groups, fillvalue=None):
+        for item in batch:
+            if item is not None:
+                yield item
+
+
+class _FeedClientMixin:
+    """Download and parse Google News RSS feeds over a shared HTTP session.
+
+    ``gnews`` hands every feed URL straight to :func:`feedparser.parse`, which
+    opens a fresh TCP+TLS connection per query. Downloading the feed through a
+    pooled :class:`requests.Session` keeps the connection to Google News alive
+    across all search terms. The RSS is then parsed with ``lxml`` (falling back
+    to :mod:`xml.etree`) rather than feedparser's much slower generic parser.
+
+    Feeds that carried an ``ETag`` or ``Last-Modified`` header are requested
+    conditionally; on ``304 Not Modified`` the items parsed last time are
+    reused from ``feed_cache`` and the body is neither downloaded nor parsed.
+
+    Google News item links are redirects, and gnews resolves each one with a
+    bare ``requests.head`` call while parsing the feed. Here the links are
+    kept as they are, and :meth:`resolve_url` follows them through the same
+    session only for the articles that are actually selected.
+
+    Subclasses provide ``_session``, ``feed_cache``, ``_max_results``,
+    ``_exclude_websites``, ``_ceid()`` and ``_clean()``.
+    """
+
+    def _get_news(self, query: str) -> list[dict]:
+        url = BASE_URL + query + self._ceid()
+        cached = self.feed_cache.get(url)
+        headers = {}
+        if cached and cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
+        if cached and cached.get("last_modified"):
+            headers["If-Modified-Since"] = cached["last_modified"]
+        try:
+            with self._session.get(
+                url, headers=headers, timeout=10, stream=True
+            ) as response:
+                if cached and response.status_code == 304:
+                    return cached["items"]
+                response.raise_for_status()
+                response.raw.decode_content = True
+                articles = self._parse_items(response.raw)
+                etag = response.headers.get("ETag")
+                last_modified = response.headers.get("Last-Modified")
+        # With stream=True the body is read by the parser straight from urllib3,
+        # so truncated, badly encoded or stalled bodies raise urllib3 errors
+        except (requests.RequestException, Urllib3Error) as exc:
+            print(f"Error fetching feed {url}: {exc}", file=sys.stderr)
+            return []
+        except ET.ParseError as exc:  # pragma: no cover - malformed feed
+            print(f"Error parsing feed {url}: {exc}", file=sys.stderr)
+            return []
+
+        if etag or last_modified:
+            self.feed_cache[url] = {
+                "etag": etag,
+                "last_modified": last_modified,
+                "items": articles,
+            }
+        else:
+            self.feed_cache.pop(url, None)
+        return articles
+
+    def _parse_items(self, stream) -> list[dict]:
+        """Stream ``<item>`` elements out of an RSS document.
+
+        Each item is processed as soon as it is closed and then cleared, so
+        only one item is held in memory at a time.
+        """
+
+        articles: list[dict] = []
+        parsed = 0
+        for _, elem in ET.iterparse(stream, events=("end",)):
+            if elem.tag != "item":
+                continue
+            article = self._process(self._entry(elem))
+            elem.clear()
+            if article:
+                articles.append(article)
+            parsed += 1
+            if parsed >= self._max_results:
+                break
+        return articles
+
+    def _process(self, item: dict) -> dict | None:
+        source = item["source"]["href"]
+        if any(
+            re.match(f"^http(s)?://(www.)?{website.lower()}.*", source)
+            for website in self._exclude_websites
+        ):
+            return None
 
-from gnews import GNews
+        return {
+            "title": item.get("title", ""),
+            "description": self._clean(item.get("description", "")),
+            "published date": item.get("published", ""),
+            "url": item.get("link", ""),
+            "publisher": item.get("source", " "),
+        }
+
+    def resolve_url(self, url: str) -> str:
+        """Return the publisher URL a Google News redirect link points to."""
+
+        if _GOOGLE_NEWS_RE.match(url):
+            try:
+                url = self._session.head(url, timeout=10).headers.get("location", url)
+            except requests.RequestException:  # pragma: no cover - keep Google link
+                pass
+        return url
+
+    @staticmethod
+    def _entry(item) -> dict:
+        """Convert an RSS ``<item>`` into the feedparser-style entry gnews expects."""
+
+        source = item.find("source")
+        return {
+            "title": item.findtext("title", ""),
+            "link": item.findtext("link", ""),
+            "published": item.findtext("pubDate", ""),
+            "description": item.findtext("description", ""),
+            "source": {
+                "href": source.get("url", "") if source is not None else "",
+                "title": (source.text or "") if source is not None else "",
+            },
+        }
+
+
+if GNews is not None:
+
+    class _SessionGNews(_FeedClientMixin, GNews):
+        """:class:`GNews` client whose feed downloads use :class:`_FeedClientMixin`."""
+
+        def __init__(
+            self, session: requests.Session, feed_cache: dict[str, dict], **kwargs
+        ) -> None:
+            super().__init__(**kwargs)
+            self._session = session
+            self.feed_cache = feed_cache
+
+
+class _BuiltinNewsClient(_FeedClientMixin):
+    """Minimal stand-in for :class:`GNews` used when gnews is not installed.
+
+    It covers only what :class:`HVACNewsFetcher` needs: top news, keyword
+    search and HTML cleanup. Full article download is not available.
+    """
+
+    def __init__(
+        self,
+        session: requests.Session,
+        feed_cache: dict[str, dict],
+        language: str = "en",
+        country: str = "US",
+        max_results: int = 100,
+    ) -> None:
+        self._session = session
+        self.feed_cache = feed_cache
+        self._language = language
+        self._country = country
+        self._max_results = max_results
+        self._exclude_websites: list[str] = []
+
+    def get_news(self, key: str) -> list[dict]:
+        return self._get_news("/search?q=" + quote(key)) if key else []
+
+    def get_top_news(self) -> list[dict]:
+        return self._get_news("?")
+
+    def get_full_article(self, url: str) -> None:
+        return None
+
+    def _ceid(self) -> str:
+        return "&hl={0}&gl={1}&ceid={1}:{0}".format(self._language, self._country)
+
+    @staticmethod
+    def _clean(html: str) -> str:
+        return unescape(_TAG_RE.sub("", html)).replace("\xa0", " ")
 
 
 class HVACNewsFetcher:
     """Fetch and format news articles for the application."""
 
+    BESS_KEYWORDS = (
+        "battery",
+        "energy storage",
+        "megapack",
+        "grid scale",
+        "bess",
+        "lithium",
+    )
+    HVAC_KEYWORDS = (
+        "hvac",
+        "heating",
+        "ventilation",
+        "air conditioning",
+        "heat pump",
+        "refriger",
+    )
+    FINANCE_KEYWORDS = (
+        "fintech",
+        "banking",
+        "cryptocurrency",
+        "blockchain",
+        "investment",
+        "financial",
+        "finance",
+        "payment",
+        "insurance",
+        "venture capital",
+        "funding",
+    )
+
+    # Checked in order; the first category with a matching keyword wins
+    CATEGORY_KEYWORDS = (
+        ("Product Launch", ("launch", "new product", "introduce", "unveil")),
+        ("Regulatory Compliance", ("regulation", "compliance", "epa", "law", "standard")),
+        ("Market Trends", ("market", "growth", "forecast", "trend", "analysis")),
+        (
+            "Competitor Financials",
+            ("acquisition", "merger", "financial", "revenue", "profit"),
+        ),
+        (
+            "Technology Innovation",
+            ("technology", "innovation", "breakthrough", "research"),
+        ),
+    )
+
+    POTENTIAL_TAGS = (
+        "SmartHVAC",
+        "AI",
+        "EnergyEfficiency",
+        "HeatPump",
+        "BatteryStorage",
+        "Tesla",
+        "GridModernization",
+        "RenewableEnergy",
+        "EPA",
+        "Regulations",
+        "MarketGrowth",
+        "Innovation",
+        "Sustainability",
+        "IoT",
+        "Automation",
+        "CommercialHVAC",
+        "ResidentialHVAC",
+        "Carrier",
+        "Honeywell",
+        "JohnsonControls",
+        "Trane",
+        "Rheem",
+        "LGEnergy",
+        "BYD",
+        "EnergyStorage",
+        "Fintech",
+        "Blockchain",
+        "Cryptocurrency",
+        "DigitalPayments",
+        "Banking",
+        "Investment",
+        "VentureCapital",
+        "InsurTech",
+        "RegTech",
+        "WealthTech",
+        "LendingTech",
+        "CentralBank",
+        "FinancialRegulation",
+        "Trading",
+        "RoboAdvisor",
+    )
+
     def __init__(self) -> None:
         # HVAC, BESS, and Finance related search terms
         self.search_terms = [
@@ -47,76 +369,196 @@ class HVACNewsFetcher:
             "central bank policy",
         ]
 
-        # Configure GNews client
-        self.client = GNews(language="en", country="US")
-        self.client.max_results = 100
+        # Shared keep-alive session; the pool is sized for the worker threads
+        self._session = requests.Session()
+        self._session.headers.update(
+            {"User-Agent": "Mozilla/5.0", "Accept-Encoding": "gzip"}
+        )
+        self._session.mount(
+            "https://", HTTPAdapter(pool_connections=1, pool_maxsize=16)
+        )
+
+        # Configure the Google News client, preferring gnews when installed
+        client_cls = _SessionGNews if GNews is not None else _BuiltinNewsClient
+        self.client = client_cls(
+            self._session,
+            self._load_feed_cache(),
+            language="en",
+            country="US",
+            max_results=100,
+        )
+
+        # Upper bound on concurrent Google News queries
+        self.max_workers = 10
+
+        # The same few dozen publishers repeat across feeds; share one string each
+        self._source_intern: dict[str, str] = {}
+
+        # Timestamp used for articles without a usable publication date
+        self._now_iso = datetime.now(timezone.utc).isoformat()
+
+        # Split camel-cased tags (e.g., "SmartHVAC" -> "smart hvac") so each
+        # component can be matched individually within the article text.
+        self._tag_specs = [
+            (tag, tuple(tag.lower().replace("hvac", " hvac").split()))
+            for tag in self.POTENTIAL_TAGS
+        ]
+
+        # One Aho-Corasick automaton over every classifier keyword lets each
+        # article be scanned in a single pass instead of once per keyword.
+        keywords = {
+            *self.BESS_KEYWORDS,
+            *self.HVAC_KEYWORDS,
+            *self.FINANCE_KEYWORDS,
+            *(word for _, words in self.CATEGORY_KEYWORDS for word in words),
+            *(word for _, words in self._tag_specs for word in words),
+        }
+        self._automaton = ahocorasick.Automaton()
+        for keyword in keywords:
+            self._automaton.add_word(keyword, keyword)
+        self._automaton.make_automaton()
 
     # ------------------------------------------------------------------
     # Public API
     # ------------------------------------------------------------------
     def fetch_articles(self, max_articles: int = 50) -> list[dict]:
-        """Fetch news articles related to the defined industries."""
+        """Fetch news articles related to the defined industries.
 
-        all_articles: list[dict] = []
-        seen_titles: set[str] = set()
+        Every query is fetched before anything is selected, so the result does
+        not depend on which query answers first.  Items are de-duplicated by
+        title and bucketed by industry, with top news in a bucket of its own,
+        and then picked from the buckets in turn.
+        """
 
-        try:
-            top_news = self.client.get_top_news()
-        except Exception as exc:  # pragma: no cover - network robustness
-            raise RuntimeError(f"GNews error fetching top news: {exc}") from exc
+        self._now_iso = datetime.now(timezone.utc).isoformat()
+        seen_hashes: set[int] = set()
+        buckets: dict[str, list[tuple[str, str, str, str, str, set[str]]]] = {}
+        top_stories: list[tuple[str, str, str, str, str, set[str]]] = []
 
-        def process_item(item: dict) -> None:
+        def collect_item(item: dict) -> tuple[str, str, str, str, str, set[str]] | None:
             title = (item.get("title") or "").strip()
-            if not title or title in seen_titles:
-                return
-            seen_titles.add(title)
-
-            description = unescape(
-                re.sub("<[^<]+?>", "", item.get("description") or "").strip()
+            if not title:
+                return None
+            title_hash = _title_hash(title)
+            if title_hash in seen_hashes:
+                return None
+            seen_hashes.add(title_hash)
+
+            description = item.get("description") or ""
+            if "<" in description:
+                description = _TAG_RE.sub("", description)
+            if "&" in description:
+                description = unescape(description)
+            description = description.strip()
+            return (
+                title,
+                description,
+                (item.get("url") or "").strip(),
+                item.get("publisher", {}).get("title") or "Unknown Source",
+                item.get("published date", ""),
+                self._match_keywords(f"{title} {description}".lower()),
             )
-            article = {
-                "title": title,
-                "description": description,
-                "url": (item.get("url") or "").strip(),
-                "publisher": item.get("publisher", {}),
-                "published date": item.get("published date", ""),
-            }
-            formatted = self._format_article(article)
-            if formatted:
-                all_articles.append(formatted)
 
-        for item in top_news:
-            process_item(item)
-            if len(all_articles) >= max_articles:
-                return all_articles[:max_articles]
-
-        for term in self.search_terms:
+        # The queries are I/O bound, so issue them concurrently and collect the
+        # results on this thread only; ``seen_hashes`` then needs no locking.
+        # Results are consumed in submission order to keep the output stable.
+        executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        try:
+            top_future = executor.submit(self.client.get_top_news)
+            futures = [executor.submit(self._fetch_one, term) for term in self.search_terms]
+            for future in futures:
+                for item in future.result():
+                    fields = collect_item(item)
+                    if fields:
+                        industry = self._determine_industry(fields[-1])
+                        buckets.setdefault(industry, []).append(fields)
             try:
-                search_results = self.client.get_news(term)
+                top_news = top_future.result()
             except Exception as exc:  # pragma: no cover - network robustness
-                raise RuntimeError(
-                    f"GNews error fetching articles for term '{term}': {exc}"
-                ) from exc
+                raise RuntimeError(f"Error fetching top news: {exc}") from exc
+            for item in top_news or []:
+                fields = collect_item(item)
+                if fields:
+                    top_stories.append(fields)
+
+            selected = list(
+                islice(_round_robin([*buckets.values(), top_stories]), max_articles)
+            )
+            # Resolving a redirect is a HEAD round trip; do the chosen ones in parallel
+            urls = list(
+                executor.map(self.client.resolve_url, [fields[2] for fields in selected])
+            )
+        finally:
+            # If a query fails, drop the queued ones. Those already running are
+            # still waited for, as they share the session and feed cache that
+            # the caller goes on to save and close.
+            executor.shutdown(wait=True, cancel_futures=True)
 
-            for item in search_results:
-                process_item(item)
-                if len(all_articles) >= max_articles:
-                    return all_articles[:max_articles]
+        all_articles: list[dict] = []
+        for fields, url in zip(selected, urls):
+            formatted = self._format_article(*fields[:2], url, *fields[3:])
+            if formatted:
+                all_articles.append(formatted)
+        return all_articles
 
-        return all_articles[:max_articles]
+    def close(self) -> None:
+        """Persist the feed cache and release the pooled HTTP connections."""
+
+        try:
+            FEED_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+            FEED_CACHE_PATH.write_text(json.dumps(self.client.feed_cache))
+        except OSError as exc:  # pragma: no cover - cache is best effort
+            print(f"Error saving feed cache: {exc}", file=sys.stderr)
+        self._session.close()
 
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
-    def _format_article(self, article: dict) -> dict | None:
-        """Format a single article for the HVAC Intel platform."""
+    @staticmethod
+    def _load_feed_cache() -> dict[str, dict]:
+        """Load the feed cache, or start empty if it is missing or malformed."""
+
+        try:
+            cache = json.loads(FEED_CACHE_PATH.read_text())
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(cache, dict) or not all(
+            isinstance(entry, dict)
+            and isinstance(entry.get("items"), list)
+            and {"etag", "last_modified"} <= entry.keys()
+            for entry in cache.values()
+        ):
+            return {}
+        return cache
+
+    def _fetch_one(self, term: str) -> list[dict]:
+        """Fetch the raw Google News results for a single search term."""
+
+        try:
+            return self.client.get_news(term) or []
+        except Exception as exc:  # pragma: no cover - network robustness
+            raise RuntimeError(
+                f"Error fetching articles for term '{term}': {exc}"
+            ) from exc
+
+    def _format_article(
+        self,
+        title: str,
+        description: str,
+        url: str,
+        publisher: str,
+        published_date: str,
+        matched: set[str],
+    ) -> dict | None:
+        """Format a single article for the HVAC Intel platform.
+
+        The fields are expected to be stripped already by the caller, and
+        ``matched`` holds the classifier keywords found in the title and
+        description when the article was bucketed.
+        """
 
         try:
-            title = article.get("title", "").strip()
-            description = article.get("description", "").strip()
-            url = article.get("url", "")
-            publisher = article.get("publisher", {}).get("title", "Unknown Source")
-            published_date = article.get("published date", "")
+            publisher = self._source_intern.setdefault(publisher, publisher)
 
             if not title:
                 return None
@@ -132,17 +574,15 @@ class HVACNewsFetcher:
                 if not content:
                     content = title
 
-            try:
-                parsed_date = (
-                    parsedate_to_datetime(published_date)
-                    if published_date
-                    else datetime.utcnow()
-                )
-            except Exception:
-                parsed_date = datetime.utcnow()
+            published_at = self._now_iso
+            if published_date:
+                try:
+                    published_at = parsedate_to_datetime(published_date).isoformat()
+                except (TypeError, ValueError):
+                    pass
 
-            industry = self._determine_industry(title, content)
-            category = self._determine_category(title, content)
+            industry = self._determine_industry(matched)
+            category = self._determine_category(matched)
 
             formatted_article = {
                 "title": title,
@@ -152,8 +592,8 @@ class HVACNewsFetcher:
                 "category": category,
                 "industry": industry,
                 "url": url,
-                "publishedAt": parsed_date.isoformat(),
-                "tags": self._extract_tags(title, content),
+                "publishedAt": published_at,
+                "tags": self._extract_tags(matched),
             }
 
             return formatted_article
@@ -161,42 +601,15 @@ class HVACNewsFetcher:
             print(f"Error formatting article: {exc}", file=sys.stderr)
             return None
 
-    def _determine_industry(self, title: str, content: str) -> str:
-        text = (title + " " + content).lower()
+    def _match_keywords(self, text_lc: str) -> set[str]:
+        """Return every classifier keyword occurring in lowercased ``text_lc``."""
 
-        bess_keywords = [
-            "battery",
-            "energy storage",
-            "megapack",
-            "grid scale",
-            "bess",
-            "lithium",
-        ]
-        hvac_keywords = [
-            "hvac",
-            "heating",
-            "ventilation",
-            "air conditioning",
-            "heat pump",
-            "refriger",
-        ]
-        finance_keywords = [
-            "fintech",
-            "banking",
-            "cryptocurrency",
-            "blockchain",
-            "investment",
-            "financial",
-            "finance",
-            "payment",
-            "insurance",
-            "venture capital",
-            "funding",
-        ]
+        return {keyword for _, keyword in self._automaton.iter(text_lc)}
 
-        bess_score = sum(1 for keyword in bess_keywords if keyword in text)
-        hvac_score = sum(1 for keyword in hvac_keywords if keyword in text)
-        finance_score = sum(1 for keyword in finance_keywords if keyword in text)
+    def _determine_industry(self, matched: set[str]) -> str:
+        bess_score = len(matched.intersection(self.BESS_KEYWORDS))
+        hvac_score = len(matched.intersection(self.HVAC_KEYWORDS))
+        finance_score = len(matched.intersection(self.FINANCE_KEYWORDS))
 
         if finance_score > max(bess_score, hvac_score):
             return "Finance"
@@ -205,106 +618,45 @@ class HVACNewsFetcher:
         else:
             return "HVAC"
 
-    def _determine_category(self, title: str, content: str) -> str:
-        text = (title + " " + content).lower()
-
-        if any(word in text for word in ["launch", "new product", "introduce", "unveil"]):
-            return "Product Launch"
-        elif any(word in text for word in ["regulation", "compliance", "epa", "law", "standard"]):
-            return "Regulatory Compliance"
-        elif any(word in text for word in ["market", "growth", "forecast", "trend", "analysis"]):
-            return "Market Trends"
-        elif any(
-            word in text for word in ["acquisition", "merger", "financial", "revenue", "profit"]
-        ):
-            return "Competitor Financials"
-        elif any(
-            word in text
-            for word in ["technology", "innovation", "breakthrough", "research"]
-        ):
-            return "Technology Innovation"
-        else:
-            return "Industry Analysis"
+    def _determine_category(self, matched: set[str]) -> str:
+        for category, words in self.CATEGORY_KEYWORDS:
+            if not matched.isdisjoint(words):
+                return category
+        return "Industry Analysis"
 
     def _generate_summary(self, content: str) -> str:
         if len(content) <= 120:
             return content
 
-        sentences = content.split(". ")
-        if sentences and len(sentences[0]) <= 120:
-            return sentences[0] + "."
+        match = _SENT_RE.match(content)
+        if match:
+            return match.group(1) + "."
 
-        words = content.split()
-        summary = ""
-        for word in words:
-            if len(summary + word) > 120:
-                break
-            summary += word + " "
-
-        return summary.strip() + "..."
-
-    def _extract_tags(self, title: str, content: str) -> list[str]:
-        text = (title + " " + content).lower()
-
-        potential_tags = [
-            "SmartHVAC",
-            "AI",
-            "EnergyEfficiency",
-            "HeatPump",
-            "BatteryStorage",
-            "Tesla",
-            "GridModernization",
-            "RenewableEnergy",
-            "EPA",
-            "Regulations",
-            "MarketGrowth",
-            "Innovation",
-            "Sustainability",
-            "IoT",
-            "Automation",
-            "CommercialHVAC",
-            "ResidentialHVAC",
-            "Carrier",
-            "Honeywell",
-            "JohnsonControls",
-            "Trane",
-            "Rheem",
-            "LGEnergy",
-            "BYD",
-            "EnergyStorage",
-            "Fintech",
-            "Blockchain",
-            "Cryptocurrency",
-            "DigitalPayments",
-            "Banking",
-            "Investment",
-            "VentureCapital",
-            "InsurTech",
-            "RegTech",
-            "WealthTech",
-            "LendingTech",
-            "CentralBank",
-            "FinancialRegulation",
-            "Trading",
-            "RoboAdvisor",
-        ]
+        return textwrap.shorten(content, width=120, placeholder="...")
 
+    def _extract_tags(self, matched: set[str]) -> list[str]:
         found_tags: list[str] = []
-        for tag in potential_tags:
-            # Split camel-cased tags (e.g., "SmartHVAC" -> "smart hvac") so each
-            # component can be matched individually within the article text.
-            tag_words = tag.lower().replace("hvac", " hvac").split()
-            if all(word in text for word in tag_words):
+        for tag, words in self._tag_specs:
+            if matched.issuperset(words):
                 found_tags.append(tag)
-
-        return found_tags[:5]
+                if len(found_tags) == 5:
+                    break
+        return found_tags
 
 
 def main() -> None:
     try:
         fetcher = HVACNewsFetcher()
-        articles = fetcher.fetch_articles(max_articles=30)
-        print(json.dumps(articles, indent=2))
+        try:
+            articles = fetcher.fetch_articles(max_articles=30)
+        finally:
+            fetcher.close()
+        # Compact output: the consumer is the Node.js server, not a person
+        if orjson is not None:
+            sys.stdout.buffer.write(orjson.dumps(articles))
+            sys.stdout.buffer.write(b"\n")
+        else:
+            print(json.dumps(articles, separators=(",", ":"), ensure_ascii=False))
     except Exception as exc:  # pragma: no cover - robustness
         # Surface errors to the Node handler in a structured format
         print(json.dumps({"error": str(exc)}))
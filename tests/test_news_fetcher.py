@@ -0,0 +1,492 @@
+"""Tests for ``server/services/news_fetcher.py`` against a local feed server."""
+
+import gzip
+import io
+import importlib.util
+import json
+import sys
+import tempfile
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from unittest import mock
+from urllib.parse import parse_qs, urlsplit
+
+import requests
+
+MODULE_PATH = (
+    Path(__file__).resolve().parents[1] / "server" / "services" / "news_fetcher.py"
+)
+
+
+def load_module(name: str = "news_fetcher"):
+    spec = importlib.util.spec_from_file_location(name, MODULE_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+news_fetcher = load_module()
+
+
+def make_feed(
+    prefix: str,
+    count: int,
+    link_base: str = "https://example.com",
+    description: bool = True,
+    source: bool = True,
+) -> bytes:
+    items = []
+    for i in range(count):
+        summary = (
+            f"<description>&lt;a href=\"https://example.com/{i}\"&gt;{prefix} {i}"
+            "&lt;/a&gt;&amp;nbsp;&amp;nbsp;</description>"
+            if description
+            else ""
+        )
+        publisher = (
+            f'<source url="https://pub{i % 7}.example">Pub {i % 7}</source>'
+            if source
+            else ""
+        )
+        items.append(
+            f"<item><title>{prefix} {i}</title><link>{link_base}/{i}</link>"
+            f"<pubDate>Tue, 02 Jan 2024 10:00:00 GMT</pubDate>{summary}{publisher}"
+            "</item>"
+        )
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?><rss version="2.0"><channel>'
+        f"<title>{prefix}</title>{''.join(items)}</channel></rss>"
+    ).encode()
+
+
+class FeedHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self) -> None:
+        server = self.server
+        server.requests.append((self.path, dict(self.headers)))
+        if (server.etag and self.headers.get("If-None-Match") == server.etag) or (
+            server.last_modified
+            and self.headers.get("If-Modified-Since") == server.last_modified
+        ):
+            self.send_response(304)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        body = server.make_body(self.path)
+        if server.gzip:
+            body = gzip.compress(body)
+        if server.corrupt:
+            body = body[:20] + bytes(200) + body[220:]
+        self.send_response(200)
+        self.send_header("Content-Type", "application/rss+xml")
+        if server.gzip:
+            self.send_header("Content-Encoding", "gzip")
+        if server.etag:
+            self.send_header("ETag", server.etag)
+        if server.last_modified:
+            self.send_header("Last-Modified", server.last_modified)
+        if server.truncate:
+            # Promise the whole body, send half of it and hang up
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body[: len(body) // 2])
+            self.close_connection = True
+        elif server.chunked:
+            self.send_header("Transfer-Encoding", "chunked")
+            self.end_headers()
+            for start in range(0, len(body), 4096):
+                chunk = body[start : start + 4096]
+                self.wfile.write(b"%x\r\n%s\r\n" % (len(chunk), chunk))
+            self.wfile.write(b"0\r\n\r\n")
+        else:
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+    def log_message(self, format, *args) -> None:
+        pass
+
+
+def make_fetcher():
+    """Build an ``HVACNewsFetcher`` whose feed cache lives in a temporary file."""
+
+    with tempfile.TemporaryDirectory() as tmp, mock.patch.object(
+        news_fetcher, "FEED_CACHE_PATH", Path(tmp) / "rss_etags.json"
+    ):
+        return news_fetcher.HVACNewsFetcher()
+
+
+class FeedServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def handle_error(self, request, client_address) -> None:
+        # Clients drop keep-alive connections and stop reading long feeds early
+        if not isinstance(sys.exc_info()[1], ConnectionError):
+            super().handle_error(request, client_address)
+
+
+class FeedServerTestCase(unittest.TestCase):
+    """Serve RSS on localhost and point ``BASE_URL`` at it."""
+
+    def setUp(self) -> None:
+        self.server = FeedServer(("127.0.0.1", 0), FeedHandler)
+        self.server.requests = []
+        self.server.make_body = lambda path: make_feed("Story", 30)
+        self.server.gzip = False
+        self.server.chunked = False
+        self.server.etag = None
+        self.server.last_modified = None
+        self.server.truncate = False
+        self.server.corrupt = False
+        thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        thread.start()
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.server.shutdown)
+
+        base_url = "http://127.0.0.1:%d/rss" % self.server.server_address[1]
+        patcher = mock.patch.object(news_fetcher, "BASE_URL", base_url)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.session = requests.Session()
+        self.session.headers.update({"Accept-Encoding": "gzip"})
+        self.addCleanup(self.session.close)
+
+    def make_client(self, module=news_fetcher, feed_cache=None):
+        return module._BuiltinNewsClient(
+            self.session, {} if feed_cache is None else feed_cache
+        )
+
+
+class GetNewsTest(FeedServerTestCase):
+    def test_parses_served_feed(self) -> None:
+        for use_gzip in (False, True):
+            for chunked in (False, True):
+                for count in (30, 5000):
+                    with self.subTest(gzip=use_gzip, chunked=chunked, count=count):
+                        self.server.gzip = use_gzip
+                        self.server.chunked = chunked
+                        self.server.make_body = lambda path: make_feed("Story", count)
+                        client = self.make_client()
+                        articles = client._get_news("/search?q=hvac")
+
+                        self.assertEqual(len(articles), min(count, 100))
+                        self.assertEqual(
+                            articles[1],
+                            {
+                                "title": "Story 1",
+                                "description": "Story 1  ",
+                                "published date": "Tue, 02 Jan 2024 10:00:00 GMT",
+                                "url": "https://example.com/1",
+                                "publisher": {
+                                    "href": "https://pub1.example",
+                                    "title": "Pub 1",
+                                },
+                            },
+                        )
+
+    def test_broken_body_drops_only_that_feed(self) -> None:
+        for use_gzip, truncate, corrupt, message in (
+            (False, True, False, "IncompleteRead"),
+            (True, True, False, "IncompleteRead"),
+            (True, False, True, "failed to decode"),
+        ):
+            with self.subTest(gzip=use_gzip, truncate=truncate, corrupt=corrupt):
+                self.server.gzip = use_gzip
+                self.server.truncate = truncate
+                self.server.corrupt = corrupt
+                self.server.make_body = lambda path: make_feed("Story", 30)
+                client = self.make_client()
+                with mock.patch("sys.stderr", new_callable=io.StringIO) as stderr:
+                    articles = client._get_news("/search?q=hvac")
+
+                self.assertEqual(articles, [])
+                self.assertIn("Error fetching feed", stderr.getvalue())
+                self.assertIn(message, stderr.getvalue())
+                self.assertEqual(client.feed_cache, {})
+
+
+class FeedCacheTest(FeedServerTestCase):
+    def test_not_modified_reuses_cached_items(self) -> None:
+        for etag, last_modified in (
+            ('"v1"', None),
+            (None, "Tue, 02 Jan 2024 10:00:00 GMT"),
+        ):
+            with self.subTest(etag=etag, last_modified=last_modified):
+                self.server.requests.clear()
+                self.server.etag = etag
+                self.server.last_modified = last_modified
+                self.server.make_body = lambda path: make_feed("Story", 30)
+                feed_cache = {}
+                client = self.make_client(feed_cache=feed_cache)
+                first = client._get_news("/search?q=hvac")
+                self.assertEqual(len(first), 30)
+                self.assertEqual(len(feed_cache), 1)
+
+                # A changed body would show up if the feed were downloaded again
+                self.server.make_body = lambda path: make_feed("Changed", 30)
+                second = client._get_news("/search?q=hvac")
+
+                self.assertEqual(second, first)
+                headers = self.server.requests[1][1]
+                self.assertEqual(headers.get("If-None-Match"), etag)
+                self.assertEqual(headers.get("If-Modified-Since"), last_modified)
+
+    def test_load_feed_cache_rejects_malformed_files(self) -> None:
+        entry = {"etag": '"v1"', "last_modified": None, "items": []}
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "rss_etags.json"
+            with mock.patch.object(news_fetcher, "FEED_CACHE_PATH", path):
+                load = news_fetcher.HVACNewsFetcher._load_feed_cache
+                self.assertEqual(load(), {})
+                for text in (
+                    "not json",
+                    "[]",
+                    '{"url": []}',
+                    '{"url": {"etag": "x"}}',
+                    '{"url": {"etag": "x", "last_modified": null, "items": {}}}',
+                ):
+                    with self.subTest(text=text):
+                        path.write_text(text)
+                        self.assertEqual(load(), {})
+
+                path.write_text(json.dumps({"url": entry}))
+                self.assertEqual(load(), {"url": entry})
+
+
+class BuiltinClientTest(FeedServerTestCase):
+    def test_fetches_feeds_without_gnews(self) -> None:
+        with mock.patch.dict(sys.modules, {"gnews": None}):
+            module = load_module("news_fetcher_without_gnews")
+        self.assertIsNone(module.GNews)
+        self.assertFalse(hasattr(module, "_SessionGNews"))
+
+        with tempfile.TemporaryDirectory() as tmp, mock.patch.object(
+            module, "FEED_CACHE_PATH", Path(tmp) / "rss_etags.json"
+        ), mock.patch.object(module, "BASE_URL", news_fetcher.BASE_URL):
+            fetcher = module.HVACNewsFetcher()
+            self.addCleanup(fetcher._session.close)
+            self.assertIsInstance(fetcher.client, module._BuiltinNewsClient)
+            self.assertIsNone(fetcher.client.get_full_article("https://example.com/0"))
+
+            client = self.make_client(module)
+            news = client.get_news("heat pump")
+            top_news = client.get_top_news()
+
+        self.assertEqual(
+            [path for path, _ in self.server.requests],
+            [
+                "/rss/search?q=heat%20pump&hl=en&gl=US&ceid=US:en",
+                "/rss?&hl=en&gl=US&ceid=US:en",
+            ],
+        )
+        self.assertEqual(len(news), 30)
+        self.assertEqual(len(top_news), 30)
+        self.assertEqual(news[0]["title"], "Story 0")
+        self.assertEqual(news[0]["description"], "Story 0  ")
+        self.assertEqual(news[0]["publisher"]["title"], "Pub 0")
+
+
+class FetchArticlesTest(FeedServerTestCase):
+    SEARCH_TERMS = [
+        "HVAC industry news",
+        "heat pump technology",
+        "battery energy storage systems BESS",
+        "financial technology fintech",
+        "HVAC industry news",
+    ]
+    # Queries whose feed items carry no description
+    BARE = set()
+
+    def setUp(self) -> None:
+        super().setUp()
+
+        def make_body(path: str) -> bytes:
+            query = parse_qs(urlsplit(path).query)
+            prefix = query["q"][0] if "q" in query else "Top story"
+            link_base = "https://news.google.com/rss/articles/" + prefix.replace(" ", "-")
+            return make_feed(prefix, 5, link_base, description=prefix not in self.BARE)
+
+        self.server.make_body = make_body
+
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        patcher = mock.patch.object(
+            news_fetcher, "FEED_CACHE_PATH", Path(tmp.name) / "rss_etags.json"
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.fetcher = news_fetcher.HVACNewsFetcher()
+        self.addCleanup(self.fetcher._session.close)
+        self.fetcher.search_terms = list(self.SEARCH_TERMS)
+
+        self.head_threads = []
+
+        def head(url: str, timeout: float) -> mock.Mock:
+            self.head_threads.append(threading.current_thread())
+            location = url.replace(
+                "https://news.google.com/rss/articles/", "https://publisher.example/"
+            )
+            return mock.Mock(headers={"location": location})
+
+        self.head = mock.patch.object(
+            self.fetcher._session, "head", side_effect=head
+        ).start()
+        self.addCleanup(mock.patch.stopall)
+
+    def test_resolves_redirects_only_for_returned_articles(self) -> None:
+        articles = self.fetcher.fetch_articles(max_articles=6)
+
+        self.assertEqual(len(articles), 6)
+        self.assertEqual(self.head.call_count, 6)
+        self.assertNotIn(threading.main_thread(), self.head_threads)
+        self.assertEqual(
+            articles[0]["url"], "https://publisher.example/HVAC-industry-news/0"
+        )
+
+    def test_picks_from_each_bucket_in_turn(self) -> None:
+        articles = self.fetcher.fetch_articles(max_articles=8)
+
+        self.assertEqual(
+            [(article["title"], article["industry"]) for article in articles],
+            [
+                ("HVAC industry news 0", "HVAC"),
+                ("battery energy storage systems BESS 0", "BESS"),
+                ("financial technology fintech 0", "Finance"),
+                ("Top story 0", "HVAC"),
+                ("HVAC industry news 1", "HVAC"),
+                ("battery energy storage systems BESS 1", "BESS"),
+                ("financial technology fintech 1", "Finance"),
+                ("Top story 1", "HVAC"),
+            ],
+        )
+
+    def test_drops_duplicate_titles_across_queries(self) -> None:
+        articles = self.fetcher.fetch_articles(max_articles=50)
+
+        titles = [article["title"] for article in articles]
+        self.assertEqual(len(titles), 25)
+        self.assertEqual(len(set(titles)), 25)
+        # The HVAC bucket holds two queries and outlasts the others
+        self.assertEqual(titles[-5:], [f"heat pump technology {i}" for i in range(5)])
+
+    def test_industry_matches_bucket_when_full_article_is_used(self) -> None:
+        self.BARE = {"financial technology fintech"}
+        full_article = mock.Mock(text="Lithium battery energy storage for the grid")
+        with mock.patch.object(
+            self.fetcher.client, "get_full_article", return_value=full_article
+        ):
+            articles = self.fetcher.fetch_articles(max_articles=3)
+
+        self.assertEqual(articles[2]["title"], "financial technology fintech 0")
+        self.assertEqual(articles[2]["content"], full_article.text)
+        self.assertEqual(articles[2]["industry"], "Finance")
+
+    def test_item_without_source_gets_placeholder(self) -> None:
+        self.server.make_body = lambda path: make_feed("HVAC news", 1, source=False)
+        self.fetcher.search_terms = ["HVAC industry news"]
+
+        articles = self.fetcher.fetch_articles(max_articles=1)
+
+        self.assertEqual(articles[0]["source"], "Unknown Source")
+
+
+class ClassifierTest(unittest.TestCase):
+    # Keywords match as plain substrings, as they always have: "ai" is found
+    # inside "air" and "blockchain", and a tie between industries is HVAC.
+    CASES = [
+        (
+            "Carrier unveils smart HVAC heat pump line for residential HVAC",
+            "HVAC",
+            "Product Launch",
+            ["SmartHVAC", "ResidentialHVAC", "Carrier"],
+        ),
+        (
+            "Tesla Megapack grid scale battery storage market growth forecast",
+            "BESS",
+            "Market Trends",
+            ["Tesla"],
+        ),
+        (
+            "EPA refrigerant regulation for air conditioning",
+            "HVAC",
+            "Regulatory Compliance",
+            ["AI", "EPA"],
+        ),
+        (
+            "Blockchain payments startup closes round",
+            "Finance",
+            "Industry Analysis",
+            ["AI", "Blockchain"],
+        ),
+        (
+            # Seven tags match; only the first five are kept
+            "AI fintech blockchain cryptocurrency banking investment trading",
+            "Finance",
+            "Industry Analysis",
+            ["AI", "Fintech", "Blockchain", "Cryptocurrency", "Banking"],
+        ),
+        (
+            "Revenue and profit rose after the merger",
+            "HVAC",
+            "Competitor Financials",
+            [],
+        ),
+        (
+            "A breakthrough in battery heating technology",
+            "HVAC",
+            "Technology Innovation",
+            [],
+        ),
+        ("Sunny with light winds", "HVAC", "Industry Analysis", []),
+    ]
+
+    def setUp(self) -> None:
+        self.fetcher = make_fetcher()
+        self.addCleanup(self.fetcher._session.close)
+
+    def test_classifies_representative_texts(self) -> None:
+        for text, industry, category, tags in self.CASES:
+            with self.subTest(text=text):
+                matched = self.fetcher._match_keywords(text.lower())
+                self.assertEqual(self.fetcher._determine_industry(matched), industry)
+                self.assertEqual(self.fetcher._determine_category(matched), category)
+                self.assertEqual(self.fetcher._extract_tags(matched), tags)
+
+
+class SummaryTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.fetcher = make_fetcher()
+        self.addCleanup(self.fetcher._session.close)
+
+    def test_short_content_is_kept_whole(self) -> None:
+        content = "a" * 120
+        self.assertEqual(self.fetcher._generate_summary(content), content)
+
+    def test_first_sentence_that_fits(self) -> None:
+        content = "Heat pumps are selling fast. " + "More detail follows here. " * 10
+        self.assertEqual(
+            self.fetcher._generate_summary(content), "Heat pumps are selling fast."
+        )
+
+    def test_long_first_sentence_is_shortened_on_a_word_boundary(self) -> None:
+        content = " ".join(f"word{i:02d}" for i in range(30)) + ". Next sentence."
+        summary = self.fetcher._generate_summary(content)
+
+        # The placeholder counts toward the 120 character limit
+        self.assertEqual(
+            summary, " ".join(f"word{i:02d}" for i in range(16)) + "..."
+        )
+        self.assertLessEqual(len(summary), 120)
+
+    def test_single_overlong_word_leaves_only_the_placeholder(self) -> None:
+        self.assertEqual(self.fetcher._generate_summary("x" * 130 + " tail"), "...")
+
+
+if __name__ == "__main__":
+    unittest.main()